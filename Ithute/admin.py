@@ -1,6 +1,6 @@
 # Ithute/admin.py
 from django.contrib import admin
-from .models import Ticket, UserProfile
+from .models import ArchivedTicket, Ticket, UserProfile
 
 @admin.register(Ticket)
 class TicketAdmin(admin.ModelAdmin):
@@ -8,6 +8,14 @@ class TicketAdmin(admin.ModelAdmin):
     list_filter = ['status', 'severity', 'branch', 'created_at']
     search_fields = ['token', 'description']
     readonly_fields = ['token', 'created_at']
+    ordering = ['-created_at']
+
+@admin.register(ArchivedTicket)
+class ArchivedTicketAdmin(admin.ModelAdmin):
+    list_display = ['token', 'reporter', 'branch', 'severity', 'solved_at', 'archived_at']
+    list_filter = ['severity', 'branch']
+    search_fields = ['token', 'description']
+    ordering = ['-archived_at']
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import ArchivedTicket, Ticket
+
+# Every Ticket column except the primary key, so new fields are archived too
+ARCHIVED_FIELDS = [field.attname for field in Ticket._meta.concrete_fields if not field.primary_key]
+
+
+def archive_candidates(older_than_days=None):
+    days = settings.TICKET_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = timezone.now() - timedelta(days=days)
+    # Tickets solved through tech_update or before solved_at existed have no solved_at
+    return (Ticket.objects.filter(status='solved')
+            .alias(solved_on=Coalesce('solved_at', 'updated_at'))
+            .filter(solved_on__lt=cutoff))
+
+
+def archive_batch(older_than_days=None, batch_size=None):
+    """Move one batch of old solved tickets to ArchivedTicket. Returns rows moved."""
+    batch_size = batch_size or settings.TICKET_ARCHIVE_BATCH_SIZE
+    # One short transaction per batch so ticket inserts never wait long on the lock
+    with transaction.atomic():
+        tickets = list(archive_candidates(older_than_days).select_for_update().order_by('pk')[:batch_size])
+        if not tickets:
+            return 0
+        pks = [ticket.pk for ticket in tickets]
+        # Re-check status in the delete: a ticket reopened since the read stays hot
+        Ticket.objects.filter(pk__in=pks, status='solved').delete()
+        kept = set(Ticket.objects.filter(pk__in=pks).values_list('pk', flat=True))
+        moved = [ticket for ticket in tickets if ticket.pk not in kept]
+        ArchivedTicket.objects.bulk_create([
+            ArchivedTicket(**{field: getattr(ticket, field) for field in ARCHIVED_FIELDS})
+            for ticket in moved
+        ])
+    return len(moved)
+
+
+def find_ticket(**lookup):
+    """First ticket matching lookup, checking the hot table before the archive."""
+    return (Ticket.objects.filter(**lookup).first()
+            or ArchivedTicket.objects.filter(**lookup).first())
+
+
+def restore_ticket(**lookup):
+    """Move an archived ticket back into Ticket, e.g. when it is reopened."""
+    with transaction.atomic():
+        archived = ArchivedTicket.objects.filter(**lookup).first()
+        if archived is None:
+            return None
+        ticket = Ticket(**{field: getattr(archived, field) for field in ARCHIVED_FIELDS})
+        ticket.save()
+        # auto_now_add/auto_now overwrite the timestamps on save(), so put them back
+        Ticket.objects.filter(pk=ticket.pk).update(
+            created_at=archived.created_at, updated_at=archived.updated_at,
+        )
+        ticket.created_at, ticket.updated_at = archived.created_at, archived.updated_at
+        archived.delete()
+    return ticket
+
+
+def token_in_use(token):
+    return (Ticket.objects.filter(token=token).exists()
+            or ArchivedTicket.objects.filter(token=token).exists())
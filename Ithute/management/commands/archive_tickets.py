@@ -0,0 +1,49 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError
+
+from Ithute.archive import archive_batch, archive_candidates
+
+
+class Command(BaseCommand):
+    help = 'Move solved tickets older than TICKET_ARCHIVE_AFTER_DAYS into the archive table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.TICKET_ARCHIVE_AFTER_DAYS,
+                            help='Archive tickets solved more than this many days ago')
+        parser.add_argument('--batch-size', type=int, default=settings.TICKET_ARCHIVE_BATCH_SIZE,
+                            help='Tickets moved per transaction')
+        parser.add_argument('--pause', type=float, default=0.1,
+                            help='Seconds to sleep between batches so other writers get the lock')
+        parser.add_argument('--max-retries', type=int, default=5,
+                            help='Retries with backoff when a batch hits a locked database')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only report how many tickets would be archived')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = archive_candidates(options['days']).count()
+            self.stdout.write(f'{count} ticket(s) would be archived')
+            return
+
+        total = 0
+        retries = 0
+        while True:
+            try:
+                moved = archive_batch(options['days'], options['batch_size'])
+            except OperationalError as exc:
+                # SQLite reports "database is locked" when a ticket write wins the race
+                retries += 1
+                if retries > options['max_retries']:
+                    raise CommandError(f'Giving up after {total} ticket(s): {exc}')
+                time.sleep(options['pause'] * 2 ** retries)
+                continue
+            retries = 0
+            # A batch whose tickets were all reopened moves nothing but is not the end
+            if not moved and not archive_candidates(options['days']).exists():
+                break
+            total += moved
+            time.sleep(options['pause'])
+        self.stdout.write(self.style.SUCCESS(f'Archived {total} ticket(s)'))
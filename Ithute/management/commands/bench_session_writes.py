@@ -0,0 +1,88 @@
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from Ithute.models import Ticket, UserProfile
+
+
+WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE')
+BENCH_PASSWORD = 'bench-pass-123'
+
+# (label, session engine, message storage)
+MODES = [
+    ('db + session messages', 'db', 'session'),
+    ('db + fallback (before, Django defaults)', 'db', 'fallback'),
+    ('db + cookie messages', 'db', 'cookie'),
+    ('cached_db + cookie messages', 'cached_db', 'cookie'),
+    ('signed_cookies + cookie messages', 'signed_cookies', 'cookie'),
+]
+
+
+class Command(BaseCommand):
+    help = 'Count DB writes per request for each session/message mode.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=5,
+                            help='How many times to replay the tech flow per mode')
+
+    def handle(self, *args, **options):
+        rounds = options['rounds']
+        # A throwaway test database, so the live db.sqlite3 is never locked or written
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write(f"{'mode':<42}{'requests':>10}{'session writes':>16}{'all writes':>12}{'per request':>13}")
+            for label, session_mode, message_mode in MODES:
+                requests, session_writes, all_writes = self.run_mode(session_mode, message_mode, rounds)
+                per_request = session_writes / requests if requests else 0
+                self.stdout.write(f"{label:<42}{requests:>10}{session_writes:>16}{all_writes:>12}{per_request:>13.2f}")
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+        self.stdout.write(f"Current mode: {settings.SESSION_MODE} sessions, {settings.MESSAGE_MODE} messages")
+
+    def run_mode(self, session_mode, message_mode, rounds):
+        username = f'bench_{uuid.uuid4().hex[:8]}'
+        user = User.objects.create_user(username=username, password=BENCH_PASSWORD)
+        UserProfile.objects.create(user=user, full_name='Bench Tech', branch='Maputsoe', role='tech')
+        ticket = Ticket.objects.create(
+            token=uuid.uuid4().hex[:8].upper(),
+            reporter=user,
+            branch='Maputsoe',
+            description='bench ticket',
+            ai_classification='General',
+            severity='LOW',
+        )
+        with override_settings(
+            SESSION_ENGINE=settings.SESSION_ENGINES[session_mode],
+            MESSAGE_STORAGE=settings.MESSAGE_STORAGES[message_mode],
+            ALLOWED_HOSTS=['testserver'],
+        ):
+            # Template errors on individual pages must not stop the count
+            client = Client(raise_request_exception=False)
+            with CaptureQueriesContext(connection) as ctx:
+                requests = self.replay(client, username, ticket.token, rounds)
+
+        writes = [q['sql'] for q in ctx.captured_queries
+                  if q['sql'].lstrip().upper().startswith(WRITE_PREFIXES)]
+        session_writes = [sql for sql in writes if 'django_session' in sql]
+        return requests, len(session_writes), len(writes)
+
+    def replay(self, client, username, token, rounds):
+        """Login, browse, update a ticket and logout, like a technician would."""
+        requests = 0
+        for _ in range(rounds):
+            client.post('/login/', {'username': username, 'password': BENCH_PASSWORD})
+            client.get('/report/')
+            client.get('/track/', {'token': token})
+            client.get('/tech-dashboard/')
+            client.post(f'/tech-update/{token}/', {'status': 'in_progress', 'notes': 'bench'})
+            client.get('/tech-dashboard/')
+            client.get('/logout/')
+            client.get('/login/')
+            requests += 8
+        return requests
@@ -18,7 +18,8 @@ class UserProfile(models.Model):
         return f"{self.full_name} - {self.branch}"
 
 
-class Ticket(models.Model):
+class TicketFields(models.Model):
+    """Fields shared by Ticket and ArchivedTicket, so archiving copies every column."""
     STATUS_CHOICES = [
         ('pending', 'Pending'),
         ('in_progress', 'In Progress'),
@@ -26,7 +27,7 @@ class Ticket(models.Model):
     ]
     
     token = models.CharField(max_length=8, unique=True)
-    reporter = models.ForeignKey(User, on_delete=models.CASCADE, related_name='tickets')
+    reporter = models.ForeignKey(User, on_delete=models.CASCADE, related_name='%(class)ss')
     branch = models.CharField(max_length=100)
     description = models.TextField()
     ai_classification = models.CharField(max_length=50)
@@ -35,11 +36,30 @@ class Ticket(models.Model):
     tech_notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    solved_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='solved_tickets')
+    solved_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='solved_%(class)ss')
     solved_at = models.DateTimeField(null=True, blank=True)
-    
+
+    class Meta:
+        abstract = True
+
+
+class Ticket(TicketFields):
     class Meta:
-        ordering = ['-created_at']
+        # No default ordering: callers must order explicitly
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='ticket_status_created_idx'),
+        ]
     
     def __str__(self):
         return f"#{self.token} - {self.status}"
+
+
+class ArchivedTicket(TicketFields):
+    """Solved tickets moved out of Ticket by the archive_tickets command."""
+    # Plain fields, so the timestamps copied from Ticket are kept as they are
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"#{self.token} - archived"
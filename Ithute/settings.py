@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -20,7 +23,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-tej-e(ki)nxi^-5!*ha8ik*douo=oz!rrw6t5(zzi3)hgp8_f*'
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', 'django-insecure-tej-e(ki)nxi^-5!*ha8ik*douo=oz!rrw6t5(zzi3)hgp8_f*')
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
@@ -82,6 +85,65 @@ DATABASES = {
 }
 
 
+# Sessions and flash messages
+# https://docs.djangoproject.com/en/6.0/topics/http/sessions/#configuring-the-session-engine
+# https://docs.djangoproject.com/en/6.0/ref/contrib/messages/#configuring-the-message-engine
+#
+# Database-backed sessions write django_session on login and logout, which
+# competes with ticket inserts for the SQLite write lock. Pick the mode with
+# ITHUTE_SESSION_MODE / ITHUTE_MESSAGE_STORAGE and compare them with
+# `python manage.py bench_session_writes`.
+#   cached_db      - (default) session reads come from the cache, but every
+#                    session write still goes to the DB, so this keeps
+#                    today's write load
+#   db             - Django's default, every session read and write hits the DB
+#   signed_cookies - the only mode that removes session writes: the session
+#                    lives in a cookie signed with SECRET_KEY. Needs
+#                    DJANGO_SECRET_KEY, because the key committed above would
+#                    let anyone forge a session. Logging out cannot revoke a
+#                    copied cookie: it can be replayed until SESSION_COOKIE_AGE
+#                    runs out.
+
+SESSION_ENGINES = {
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'db': 'django.contrib.sessions.backends.db',
+}
+
+MESSAGE_STORAGES = {
+    'cookie': 'django.contrib.messages.storage.cookie.CookieStorage',
+    'fallback': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    'session': 'django.contrib.messages.storage.session.SessionStorage',
+}
+
+SESSION_MODE = os.environ.get('ITHUTE_SESSION_MODE', 'cached_db')
+MESSAGE_MODE = os.environ.get('ITHUTE_MESSAGE_STORAGE', 'cookie')
+
+if SESSION_MODE not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"ITHUTE_SESSION_MODE must be one of {', '.join(SESSION_ENGINES)}, got {SESSION_MODE!r}"
+    )
+if MESSAGE_MODE not in MESSAGE_STORAGES:
+    raise ImproperlyConfigured(
+        f"ITHUTE_MESSAGE_STORAGE must be one of {', '.join(MESSAGE_STORAGES)}, got {MESSAGE_MODE!r}"
+    )
+
+if SESSION_MODE == 'signed_cookies':
+    if 'DJANGO_SECRET_KEY' not in os.environ:
+        raise ImproperlyConfigured('ITHUTE_SESSION_MODE=signed_cookies requires DJANGO_SECRET_KEY to be set')
+
+SESSION_ENGINE = SESSION_ENGINES[SESSION_MODE]
+MESSAGE_STORAGE = MESSAGE_STORAGES[MESSAGE_MODE]
+
+
+# Ticket archival
+# Solved tickets older than this are moved to ArchivedTicket by
+# `python manage.py archive_tickets` (run it from cron / a scheduler).
+
+TICKET_ARCHIVE_AFTER_DAYS = int(os.environ.get('ITHUTE_ARCHIVE_AFTER_DAYS', 90))
+TICKET_ARCHIVE_BATCH_SIZE = int(os.environ.get('ITHUTE_ARCHIVE_BATCH_SIZE', 500))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -0,0 +1,120 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import TestCase
+from django.utils import timezone
+
+from .archive import archive_batch
+from .models import ArchivedTicket, Ticket, UserProfile
+from .views import generate_token
+
+
+def make_ticket(token, reporter, status='solved', age_days=0, solved_at=True):
+    ticket = Ticket.objects.create(
+        token=token,
+        reporter=reporter,
+        branch='Maputsoe',
+        description='printer not working',
+        ai_classification='Hardware',
+        severity='LOW',
+        status=status,
+    )
+    # created_at/updated_at are auto fields, so age the row with update()
+    then = timezone.now() - timedelta(days=age_days)
+    Ticket.objects.filter(pk=ticket.pk).update(
+        created_at=then,
+        updated_at=then,
+        solved_at=then if status == 'solved' and solved_at else None,
+    )
+    ticket.refresh_from_db()
+    return ticket
+
+
+class ArchiveBatchTests(TestCase):
+    def setUp(self):
+        self.reporter = User.objects.create_user(username='staff', password='pass-123')
+
+    def test_moves_only_aged_solved_tickets(self):
+        old = make_ticket('OLD00001', self.reporter, age_days=200)
+        no_solved_at = make_ticket('OLD00002', self.reporter, age_days=200, solved_at=False)
+        make_ticket('NEW00001', self.reporter, age_days=5)
+        make_ticket('PEND0001', self.reporter, status='pending', age_days=200)
+
+        self.assertEqual(archive_batch(older_than_days=90, batch_size=10), 2)
+
+        self.assertEqual(
+            set(Ticket.objects.values_list('token', flat=True)), {'NEW00001', 'PEND0001'}
+        )
+        archived = ArchivedTicket.objects.get(token='OLD00001')
+        self.assertEqual(archived.created_at, old.created_at)
+        self.assertEqual(archived.solved_at, old.solved_at)
+        self.assertEqual(
+            ArchivedTicket.objects.get(token='OLD00002').created_at, no_solved_at.created_at
+        )
+
+    def test_batch_size_limits_each_transaction(self):
+        for i in range(3):
+            make_ticket(f'OLD0000{i}', self.reporter, age_days=200)
+        self.assertEqual(archive_batch(older_than_days=90, batch_size=2), 2)
+        self.assertEqual(archive_batch(older_than_days=90, batch_size=2), 1)
+        self.assertEqual(archive_batch(older_than_days=90, batch_size=2), 0)
+
+
+class ArchiveFallbackViewTests(TestCase):
+    def setUp(self):
+        self.reporter = User.objects.create_user(username='staff', password='pass-123')
+        UserProfile.objects.create(user=self.reporter, full_name='Staff', branch='Maputsoe', role='staff')
+        self.tech = User.objects.create_user(username='tech', password='pass-123')
+        UserProfile.objects.create(user=self.tech, full_name='Tech', branch='Maputsoe', role='tech')
+        self.ticket = make_ticket('ARCH0001', self.reporter, age_days=200)
+        archive_batch(older_than_days=90)
+
+    def render_context(self, url, **params):
+        """GET url and return the context handed to render()."""
+        with mock.patch('Ithute.views.render', return_value=HttpResponse()) as render:
+            self.client.get(url, params)
+        return render.call_args.args[2]
+
+    def test_ticket_detail_falls_back_to_archive(self):
+        self.client.force_login(self.tech)
+        context = self.render_context('/ticket/ARCH0001/')
+        self.assertIsInstance(context['ticket'], ArchivedTicket)
+        self.assertEqual(context['ticket'].token, 'ARCH0001')
+
+    def test_track_ticket_falls_back_to_archive(self):
+        self.client.force_login(self.reporter)
+        context = self.render_context('/track/', token='arch0001')
+        self.assertIsInstance(context['ticket'], ArchivedTicket)
+        self.assertEqual(context['ticket'].token, 'ARCH0001')
+
+    def test_reopen_restores_archived_ticket(self):
+        self.client.force_login(self.reporter)
+        response = self.client.get('/reopen/ARCH0001/')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(ArchivedTicket.objects.filter(token='ARCH0001').exists())
+        ticket = Ticket.objects.get(token='ARCH0001')
+        self.assertEqual(ticket.status, 'pending')
+        self.assertIsNone(ticket.solved_at)
+        self.assertEqual(ticket.created_at, self.ticket.created_at)
+
+    def test_generate_token_skips_archived_tokens(self):
+        with mock.patch('Ithute.views.random.choices', side_effect=[list('ARCH0001'), list('FRESH001')]):
+            self.assertEqual(generate_token(), 'FRESH001')
+
+
+class TechUpdateTests(TestCase):
+    def test_solving_sets_solved_at(self):
+        tech = User.objects.create_user(username='tech', password='pass-123')
+        UserProfile.objects.create(user=tech, full_name='Tech', branch='Maputsoe', role='tech')
+        make_ticket('BBBB0001', tech, status='pending')
+        self.client.force_login(tech)
+
+        self.client.post('/tech-update/BBBB0001/', {'status': 'solved', 'notes': 'replaced toner'})
+
+        ticket = Ticket.objects.get(token='BBBB0001')
+        self.assertEqual(ticket.status, 'solved')
+        self.assertIsNotNone(ticket.solved_at)
+        self.assertEqual(ticket.solved_by, tech)
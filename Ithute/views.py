@@ -2,9 +2,10 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import authenticate, login as auth_login, logout as auth_logout
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.utils import timezone
 from .models import Ticket, UserProfile
+from .archive import find_ticket, restore_ticket, token_in_use
 import string, random
 import os
 import pickle
@@ -21,6 +22,9 @@ def tech_update(request, token):
         return redirect('dashboard')
     ticket = get_object_or_404(Ticket, token=token)
     if request.method == 'POST':
+        if request.POST['status'] == 'solved' and ticket.status != 'solved':
+            ticket.solved_by = request.user
+            ticket.solved_at = timezone.now()
         ticket.status = request.POST['status']
         ticket.tech_notes = request.POST.get('notes', '')
         ticket.save()
@@ -56,7 +60,7 @@ def report_problem(request):
     search_token = request.GET.get('token', '').strip()
     if search_token:
         clean_token = search_token.replace('#', '').strip()
-        ticket = Ticket.objects.filter(token__iexact=clean_token).first()
+        ticket = find_ticket(token__iexact=clean_token)
         if ticket and ticket.reporter != request.user and not request.user.is_staff:
             ticket = None
         if not ticket:
@@ -106,7 +110,10 @@ def get_profile(user):
 # Generate individual tokens
 def generate_token():
     chars = string.ascii_uppercase + string.digits
-    return ''.join(random.choices(chars, k=8))
+    while True:
+        token = ''.join(random.choices(chars, k=8))
+        if not token_in_use(token):  # archived tickets keep their tokens
+            return token
 
 class Classifier:
     def __init__(self):
@@ -201,13 +208,12 @@ def track_ticket(request):
     search_token = request.GET.get('token', '').upper().strip()
     ticket = None
     if search_token:
-        try:
-            if request.user.is_staff or profile.role == 'tech':
-                ticket = Ticket.objects.get(token=search_token)
-            else:
-                ticket = Ticket.objects.filter(token=search_token, reporter=request.user).first()
-        except Ticket.DoesNotExist:
-            messages.warning(request, f'Ticket #{search_token} not found')
+        if request.user.is_staff or profile.role == 'tech':
+            ticket = find_ticket(token=search_token)
+            if ticket is None:
+                messages.warning(request, f'Ticket #{search_token} not found')
+        else:
+            ticket = find_ticket(token=search_token, reporter=request.user)
     
     context = {'ticket': ticket, 'profile': profile, 'search_token': search_token}
     return render(request, 'track.html', context)
@@ -232,13 +238,11 @@ def tech_dashboard(request):
 @login_required
 def ticket_detail(request, token):
     profile = get_profile(request.user)
-    try:
-        if request.user.is_staff or profile.role == 'tech':
-            ticket = Ticket.objects.get(token=token)
-        else:
-            ticket = Ticket.objects.get(token=token, reporter=request.user)
-    except Ticket.DoesNotExist:
-        ticket = None
+    if request.user.is_staff or profile.role == 'tech':
+        ticket = find_ticket(token=token)
+    else:
+        ticket = find_ticket(token=token, reporter=request.user)
+    if ticket is None:
         messages.error(request, 'Ticket not found')
     return render(request, 'ticket_detail.html', {'ticket': ticket, 'profile': profile})
 
@@ -270,7 +274,10 @@ def resolve_ticket(request, token):
 
 @login_required
 def reopen_ticket(request, token):
-    ticket = get_object_or_404(Ticket, token=token, reporter=request.user)
+    ticket = (Ticket.objects.filter(token=token, reporter=request.user).first()
+              or restore_ticket(token=token, reporter=request.user))
+    if ticket is None:
+        raise Http404('Ticket not found')
     if ticket.status == 'solved':
         ticket.status = 'pending'
         ticket.solved_by = None